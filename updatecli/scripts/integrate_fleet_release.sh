@@ -26,12 +26,21 @@ then
     exit 0
 fi
 
+CHARTS="fleet fleet-crd fleet-agent"
+
+# Download all chart archives in a single curl invocation so the transfers run in parallel
+set --
+for NAME in $CHARTS
+do
+    set -- "$@" -o "/tmp/${NAME}-${VERSION}.tgz" "https://github.com/rancher/fleet/releases/download/v${VERSION}/${NAME}-${VERSION}.tgz"
+done
+curl -S --no-progress-meter -L --fail --retry 5 --parallel "$@"
+
 # Remove old chart
 rm -r ./charts/fleet*
 
-for NAME in fleet fleet-crd fleet-agent
+for NAME in $CHARTS
 do
-    curl -sS -L -o "/tmp/${NAME}-${VERSION}.tgz" "https://github.com/rancher/fleet/releases/download/v${VERSION}/${NAME}-${VERSION}.tgz"
     tar -xf "/tmp/${NAME}-${VERSION}.tgz" -C ./charts/
     rm "/tmp/${NAME}-${VERSION}.tgz"
 done